@@ -393,6 +393,7 @@ import re
 import logging
 import uuid
 import json
+import bisect
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -418,6 +419,8 @@ class Recipe(BaseModel):
     id: str; title: str; image_url: str | None = None; region: str | None = None; category: str | None = None
     cooking_time: str | None = None; difficulty: str | None = None; diet_type: str | None = None
     ingredients: str | None = None; instructions: str | None = None; nutrition: str | None = None; tags: str | None = None
+    cooking_minutes: float | None = None; calories: float | None = None; carbohydrates: float | None = None; protein: float | None = None
+    fat: float | None = None; saturated_fat: float | None = None; sodium: float | None = None; fiber: float | None = None; sugar: float | None = None
 
 # --- FastAPI App & Middleware ---
 app = FastAPI(title="ShoreChef API", description="Backend for ShoreChef App.", version="3.2.0")
@@ -445,7 +448,92 @@ def parse_recipe_text(text: str) -> dict:
             section_content = [match.group(2).strip()]
         elif current_section: section_content.append(line.strip())
     if current_section: parsed_data[current_section] = '\n'.join(section_content).strip()
-    return {"title": parsed_data.get("recipe_title", ""), "image_url": parsed_data.get("imageurl", ""), "region": parsed_data.get("region", ""), "category": parsed_data.get("category", ""), "cooking_time": parsed_data.get("cooking_time", ""), "difficulty": parsed_data.get("difficulty", ""), "diet_type": parsed_data.get("diet_type", ""), "ingredients": parsed_data.get("ingredients", ""), "instructions": parsed_data.get("instructions", ""), "nutrition": parsed_data.get("nutrition", ""), "tags": parsed_data.get("tags", "")}
+    recipe = {"title": parsed_data.get("recipe_title", ""), "image_url": parsed_data.get("imageurl", ""), "region": parsed_data.get("region", ""), "category": parsed_data.get("category", ""), "cooking_time": parsed_data.get("cooking_time", ""), "difficulty": parsed_data.get("difficulty", ""), "diet_type": parsed_data.get("diet_type", ""), "ingredients": parsed_data.get("ingredients", ""), "instructions": parsed_data.get("instructions", ""), "nutrition": parsed_data.get("nutrition", ""), "tags": parsed_data.get("tags", "")}
+    recipe.update(extract_numeric_fields(recipe))
+    return recipe
+
+# --- Numeric Normalization ---
+# "cooking_minutes" comes from cooking_time, the rest from "- Calories: 140kcal" style nutrition lines.
+NUMERIC_FIELDS = ["cooking_minutes", "calories", "carbohydrates", "protein", "fat", "saturated_fat", "sodium", "fiber", "sugar"]
+NUTRITION_LINE_PATTERN = re.compile(r'^[-*\s]*([A-Za-z][A-Za-z ]*?)\s*:\s*(\d+(?:\.\d+)?)')
+MINUTES_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(?:\s*[-–]\s*(\d+(?:\.\d+)?))?\s*(minutes?|mins?|hours?|hrs?)', re.IGNORECASE)
+
+def parse_cooking_minutes(cooking_time: str | None) -> float | None:
+    # Ranges like "15–20 minutes" use the upper bound so max_time never under-promises.
+    match = MINUTES_PATTERN.search(cooking_time or "")
+    if not match: return None
+    value = float(match.group(2) or match.group(1))
+    return value * 60 if match.group(3).lower().startswith('h') else value
+
+def parse_nutrition(nutrition: str | None) -> dict:
+    values = {}
+    for line in (nutrition or "").split('\n'):
+        match = NUTRITION_LINE_PATTERN.match(line)
+        if not match: continue
+        key = match.group(1).strip().lower().replace(' ', '_')
+        if key in NUMERIC_FIELDS: values[key] = float(match.group(2))
+    return values
+
+def extract_numeric_fields(recipe: dict) -> dict:
+    # Chroma metadata can't hold None, so missing metrics are simply left out.
+    numeric = parse_nutrition(recipe.get("nutrition"))
+    minutes = parse_cooking_minutes(recipe.get("cooking_time"))
+    if minutes is not None: numeric["cooking_minutes"] = minutes
+    return numeric
+
+class RecipeNumericIndex:
+    """Per-metric sorted (value, id) lists so range filters and sorts are bisect lookups."""
+    def __init__(self):
+        self.values: dict[str, dict[str, float]] = {}
+        self.sorted_keys: dict[str, list[float]] = {}
+        self.sorted_ids: dict[str, list[str]] = {}
+        self.all_ids: list[str] = []
+
+    def build(self, ids: list[str], metadatas: list[dict]):
+        self.all_ids = list(ids)
+        self.values = {recipe_id: {**extract_numeric_fields(meta), **{k: float(meta[k]) for k in NUMERIC_FIELDS if isinstance(meta.get(k), (int, float))}} for recipe_id, meta in zip(ids, metadatas)}
+        for field in NUMERIC_FIELDS:
+            entries = sorted((vals[field], recipe_id) for recipe_id, vals in self.values.items() if field in vals)
+            self.sorted_keys[field] = [value for value, _ in entries]
+            self.sorted_ids[field] = [recipe_id for _, recipe_id in entries]
+
+    def range_ids(self, field: str, low: float | None, high: float | None) -> list[str]:
+        keys = self.sorted_keys.get(field, [])
+        start = bisect.bisect_left(keys, low) if low is not None else 0
+        end = bisect.bisect_right(keys, high) if high is not None else len(keys)
+        return self.sorted_ids.get(field, [])[start:end]
+
+    def query(self, ranges: dict[str, tuple[float | None, float | None]], sort_field: str | None = None, descending: bool = False) -> list[str]:
+        ranges = {field: bounds for field, bounds in ranges.items() if bounds != (None, None)}
+        if ranges:
+            # Drive from the narrowest bisect slice and check the other bounds per candidate.
+            driver_field, driver_ids = min(((field, self.range_ids(field, *bounds)) for field, bounds in ranges.items()), key=lambda item: len(item[1]))
+            result = [recipe_id for recipe_id in driver_ids if all(
+                field in self.values[recipe_id]
+                and (low is None or self.values[recipe_id][field] >= low)
+                and (high is None or self.values[recipe_id][field] <= high)
+                for field, (low, high) in ranges.items() if field != driver_field)]
+        else:
+            driver_field, result = None, None
+        if sort_field is None: return result if result is not None else list(self.all_ids)
+        if result is None or sort_field == driver_field:
+            # Already in index order: walk the sorted slice, recipes missing the metric go last.
+            ordered = result if result is not None else self.sorted_ids.get(sort_field, [])
+            ordered = ordered[::-1] if descending else list(ordered)
+            if result is None:
+                present = set(ordered)
+                ordered += [recipe_id for recipe_id in self.all_ids if recipe_id not in present]
+            return ordered
+        with_metric = [recipe_id for recipe_id in result if sort_field in self.values[recipe_id]]
+        with_metric.sort(key=lambda recipe_id: self.values[recipe_id][sort_field], reverse=descending)
+        return with_metric + [recipe_id for recipe_id in result if sort_field not in self.values[recipe_id]]
+
+recipe_index = RecipeNumericIndex()
+
+def build_recipe_index():
+    results = collection.get(include=["metadatas"])
+    recipe_index.build(results.get('ids') or [], results.get('metadatas') or [])
+    logger.info(f"Built numeric recipe index over {len(recipe_index.all_ids)} recipes.")
 
 def load_recipes_if_needed():
     if collection.count() > 0: return
@@ -465,6 +553,7 @@ def load_recipes_if_needed():
         documents.append(full_doc_text); metadatas.append(parsed_recipe); ids.append(recipe_id)
     if documents: collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
 load_recipes_if_needed()
+build_recipe_index()
 
 # --- Helper Functions & Prompts ---
 def get_gemini_response(full_prompt: str) -> tuple[str | None, str]:
@@ -537,13 +626,37 @@ async def get_all_categories():
     return sorted(list(unique_categories))
 
 @app.get("/recipes", response_model=list[Recipe])
-async def get_all_recipes(category: Optional[str] = Query(None), language: Optional[str] = Query("English")):
+async def get_all_recipes(category: Optional[str] = Query(None), language: Optional[str] = Query("English"),
+                          min_calories: Optional[float] = Query(None), max_calories: Optional[float] = Query(None),
+                          min_protein: Optional[float] = Query(None), max_protein: Optional[float] = Query(None),
+                          min_carbohydrates: Optional[float] = Query(None), max_carbohydrates: Optional[float] = Query(None),
+                          min_fat: Optional[float] = Query(None), max_fat: Optional[float] = Query(None),
+                          min_fiber: Optional[float] = Query(None), max_fiber: Optional[float] = Query(None),
+                          min_time: Optional[float] = Query(None), max_time: Optional[float] = Query(None),
+                          sort: Optional[str] = Query(None, description="<metric>_asc or <metric>_desc, e.g. protein_desc or time_asc.")):
     if not collection: raise HTTPException(status_code=503, detail="Database not available.")
+    sort_field, descending = None, False
+    if sort:
+        metric, _, direction = sort.lower().rpartition('_')
+        sort_field = "cooking_minutes" if metric == "time" else metric
+        if sort_field not in NUMERIC_FIELDS or direction not in ("asc", "desc"):
+            raise HTTPException(status_code=400, detail=f"Invalid sort '{sort}'. Use <metric>_asc or <metric>_desc.")
+        descending = direction == "desc"
+    ranges = {"calories": (min_calories, max_calories), "protein": (min_protein, max_protein), "carbohydrates": (min_carbohydrates, max_carbohydrates),
+              "fat": (min_fat, max_fat), "fiber": (min_fiber, max_fiber), "cooking_minutes": (min_time, max_time)}
     try:
-        results = collection.get(include=["metadatas"])
+        if any(bounds != (None, None) for bounds in ranges.values()) or sort_field:
+            matching_ids = recipe_index.query(ranges, sort_field, descending)
+            if not matching_ids: return []
+            results = collection.get(ids=matching_ids, include=["metadatas"])
+            # collection.get doesn't preserve the requested order, so restore the index order.
+            by_id = dict(zip(results['ids'], results['metadatas']))
+            results = {'ids': [i for i in matching_ids if i in by_id], 'metadatas': [by_id[i] for i in matching_ids if i in by_id]}
+        else:
+            results = collection.get(include=["metadatas"])
         if not results or not results.get('ids'): return []
-        
-        recipe_list = [Recipe(id=results['ids'][i], **results['metadatas'][i]) for i in range(len(results['ids']))]
+
+        recipe_list = [Recipe(id=results['ids'][i], **{**recipe_index.values.get(results['ids'][i], {}), **results['metadatas'][i]}) for i in range(len(results['ids']))]
 
         if category:
             recipe_list = [r for r in recipe_list if r.category and category.lower() in r.category.lower()]
@@ -594,7 +707,7 @@ async def get_recipe_by_id(recipe_id: str, lang: str = Query("en")):
     result = collection.get(ids=[recipe_id], include=["metadatas"])
     if not result or not result['ids']: raise HTTPException(status_code=404, detail="Recipe not found.")
     
-    recipe_data = result['metadatas'][0]
+    recipe_data = {**recipe_index.values.get(result['ids'][0], {}), **result['metadatas'][0]}
     
     if lang.lower() != 'en' and lang.lower() != 'english':
         prompt = TRANSLATION_PROMPT.format(